@@ -1,6 +1,9 @@
 import os
 import sys
+import json
+import atexit
 import inspect
+import importlib.util
 import traceback
 
 import pyblish.api
@@ -12,6 +15,23 @@ MODULE_DIR = os.path.dirname(__file__)
 SPLASH_PATH = os.path.join(MODULE_DIR, "splash.png")
 
 
+def _app_instance():
+    """Return the host QApplication, cached after the first lookup
+
+    The application outlives this module, so one round-trip
+    into Qt is enough for every subsequent caller.
+
+    """
+
+    app = _state.get("hostApp")
+
+    if app is None:
+        app = QtWidgets.QApplication.instance()
+        _state["hostApp"] = app
+
+    return app
+
+
 def register_dispatch_wrapper(wrapper):
     """Register a dispatch wrapper for servers
 
@@ -20,10 +40,13 @@ def register_dispatch_wrapper(wrapper):
 
     """
 
-    signature = inspect.getargspec(wrapper)
-    if any([len(signature.args) != 1,
-            signature.varargs is None,
-            signature.keywords is None]):
+    parameters = inspect.signature(wrapper).parameters.values()
+    if any([sum(parameter.kind == parameter.POSITIONAL_OR_KEYWORD
+                for parameter in parameters) != 1,
+            not any(parameter.kind == parameter.VAR_POSITIONAL
+                    for parameter in parameters),
+            not any(parameter.kind == parameter.VAR_KEYWORD
+                    for parameter in parameters)]):
         raise TypeError("Wrapper signature mismatch")
 
     _state["dispatchWrapper"] = wrapper
@@ -42,20 +65,13 @@ def current_server():
 
 
 def install():
-    """Perform first time install
-
-    Attributes:
-        initial_port (int, optional): Port from which to start
-            looking for available ports, defaults to 9001
-
-    """
+    """Perform first time install"""
 
     if _state.get("installed"):
         sys.stdout.write("Already installed, uninstalling..\n")
         uninstall()
 
     install_callbacks()
-    install_host()
 
     _state["installed"] = True
 
@@ -66,6 +82,24 @@ def uninstall():
     sys.stdout.write("Pyblish QML shutdown successful.\n")
 
 
+def _ensure_host_installed():
+    """Install host integration once, on first use
+
+    install() commonly runs at DCC startup, e.g. from a
+    userSetup.py; deferring the host module imports and Qt
+    wiring until the GUI is first needed keeps Pyblish QML
+    off the cold-start critical path for sessions that never
+    publish.
+
+    """
+
+    if _state.get("hostInstalled"):
+        return
+
+    install_host()
+    _state["hostInstalled"] = True
+
+
 def show(parent=None, targets=[]):
     """Attempt to show GUI
 
@@ -78,13 +112,25 @@ def show(parent=None, targets=[]):
     if not _state.get("installed"):
         install()
 
+    _ensure_host_installed()
+
+    current_settings = settings.to_dict()
+    settings_hash = hash(json.dumps(current_settings, sort_keys=True))
+
     # Show existing GUI
     if _state.get("currentServer"):
         server = _state["currentServer"]
         proxy = ipc.server.Proxy(server)
 
         try:
-            proxy.show(settings.to_dict())
+            if settings_hash == _state.get("lastSettingsHash"):
+                # Unchanged since the last push; the running
+                # instance reuses the settings it already has.
+                proxy.show(None)
+            else:
+                proxy.show(current_settings)
+                _state["lastSettingsHash"] = settings_hash
+
             return server
 
         except IOError:
@@ -94,18 +140,9 @@ def show(parent=None, targets=[]):
     splash = Splash()
     splash.show()
 
-    def on_shown():
-        try:
-            splash.close()
-
-        except RuntimeError:
-            # Splash already closed
-            pass
-
-        pyblish.api.deregister_callback(*callback)
-
-    callback = "pyblishQmlShown", on_shown
-    pyblish.api.register_callback(*callback)
+    # The persistent "pyblishQmlShown" callback from
+    # install_callbacks() closes this for us.
+    _state["currentSplash"] = splash
 
     try:
         service = ipc.service.Service()
@@ -113,10 +150,11 @@ def show(parent=None, targets=[]):
     except Exception:
         # If for some reason, the GUI fails to show.
         traceback.print_exc()
-        return on_shown()
+        return _on_shown()
 
     proxy = ipc.server.Proxy(server)
-    proxy.show(settings.to_dict())
+    proxy.show(current_settings)
+    _state["lastSettingsHash"] = settings_hash
 
     # Store reference to server for future calls
     _state["currentServer"] = server
@@ -127,6 +165,8 @@ def show(parent=None, targets=[]):
     return server
 
 def publish():
+    _ensure_host_installed()
+
     # get existing GUI
     if _state.get("currentServer"):
         server = _state["currentServer"]
@@ -140,6 +180,8 @@ def publish():
             _state.pop("currentServer")
 
 def validate():
+    _ensure_host_installed()
+
     # get existing GUI
     if _state.get("currentServer"):
         server = _state["currentServer"]
@@ -155,11 +197,29 @@ def validate():
 def install_callbacks():
     pyblish.api.register_callback("instanceToggled", _toggle_instance)
     pyblish.api.register_callback("pluginToggled", _toggle_plugin)
+    pyblish.api.register_callback("pyblishQmlShown", _on_shown)
 
 
 def uninstall_callbacks():
     pyblish.api.deregister_callback("instanceToggled", _toggle_instance)
     pyblish.api.deregister_callback("pluginToggled", _toggle_plugin)
+    pyblish.api.deregister_callback("pyblishQmlShown", _on_shown)
+
+
+def _on_shown():
+    """Close the splash screen once the QML window appears"""
+
+    splash = _state.pop("currentSplash", None)
+
+    if splash is None:
+        return
+
+    try:
+        splash.close()
+
+    except RuntimeError:
+        # Splash already closed
+        pass
 
 
 def _toggle_instance(instance, new_value, old_value):
@@ -210,14 +270,21 @@ def install_host():
 
     """
 
-    for install in (_install_maya,
-                    _install_houdini,
-                    _install_nuke,
-                    _install_hiero,
-                    _install_nukestudio):
+    # Fallback for interpreter-level shutdown, where Qt signals
+    # may already have been disconnected. _on_application_quit()
+    # is idempotent, so firing both is harmless.
+    atexit.register(_on_application_quit)
+
+    for probe, install in _HOST_PROBES:
+        # Probing the module spec is cheaper than attempting
+        # (and failing) a full import per unavailable host.
+        if importlib.util.find_spec(probe) is None:
+            continue
+
         try:
             install()
         except ImportError:
+            # E.g. Nuke running in Hiero or NukeStudio mode
             pass
         else:
             break
@@ -227,20 +294,73 @@ def _on_application_quit():
     """Automatically kill QML on host exit"""
 
     try:
-        _state["currentServer"].popen.kill()
+        server = _state.pop("currentServer")
 
     except KeyError:
         # No server started
-        pass
+        return
 
-    except OSError:
-        # Already dead
-        pass
+    # Kill, reap and release pipe handles in one go,
+    # so repeated sessions don't leak into the host.
+    server.stop()
+
+
+class _MainThreadInvoker(QtCore.QObject):
+    """Execute callables on the Qt main thread
+
+    Dispatch arrives on the IPC listener thread, but hosts
+    require processing to happen on their main thread. This
+    object lives on the main thread and relays calls to it
+    through a blocking queued signal, which works identically
+    in every host as opposed to each host's own flavour of
+    executeInMainThreadWithResult.
+
+    """
+
+    _requested = QtCore.Signal(object)
+
+    def __init__(self, parent=None):
+        super(_MainThreadInvoker, self).__init__(parent)
+        self._requested.connect(self._process,
+                                QtCore.Qt.BlockingQueuedConnection)
+
+    def _process(self, job):
+        try:
+            job["result"] = job["func"](*job["args"], **job["kwargs"])
+        except Exception as e:
+            job["error"] = e
+
+    def run(self, func, *args, **kwargs):
+        job = {"func": func, "args": args, "kwargs": kwargs}
+
+        if QtCore.QThread.currentThread() is self.thread():
+            # A blocking queued connection would deadlock when
+            # emitter and receiver share a thread; call directly.
+            self._process(job)
+        else:
+            self._requested.emit(job)
+
+        if "error" in job:
+            raise job["error"]
+
+        return job.get("result")
 
 
-def _connect_host_event(app):
+def _main_thread_wrapper(func, *args, **kwargs):
+    return _state["mainThreadInvoker"].run(func, *args, **kwargs)
+
+
+def _install_main_thread_invoker(app):
+    """Route dispatch through the Qt main thread of `app`"""
+    invoker = _MainThreadInvoker()
+    invoker.moveToThread(app.thread())
+    _state["mainThreadInvoker"] = invoker
+    register_dispatch_wrapper(_main_thread_wrapper)
+
+
+def _connect_host_event(app, top_window=None):
     """Connect some event from host to QML
-    
+
     Host will connect following event to QML:
     QEvent.Show                -> rise QML
     QEvent.Hide                -> hide QML
@@ -301,13 +421,13 @@ def _connect_host_event(app):
             return False
 
     # Get top window in host
-    app_top_window = app.activeWindow()
-    while True:
-        parent_window = app_top_window.parent()
-        if parent_window:
-            app_top_window = parent_window
-        else:
-            break
+    app_top_window = top_window
+    if app_top_window is None:
+        # window() resolves the top-level ancestor in a single
+        # C++ call, where walking parent() crossed the bridge
+        # once per ancestor.
+        active_window = app.activeWindow()
+        app_top_window = active_window.window() if active_window else None
     # install event filter
     try:
         host_event_filter = HostEventFilter(app_top_window)
@@ -316,46 +436,72 @@ def _connect_host_event(app):
         pass
 
 
-def _install_maya():
-    """Helper function to Autodesk Maya support"""
-    from maya import utils
+def _install_common(label, top_window=None):
+    """Shared installation steps for every supported host
 
-    def threaded_wrapper(func, *args, **kwargs):
-        return utils.executeInMainThreadWithResult(
-            func, *args, **kwargs)
+    Arguments:
+        label (str): Human-readable host name, e.g. "Maya"
+        top_window (QWidget, optional): Known main window of
+            the host, spares the lookup via activeWindow()
 
-    sys.stdout.write("Setting up Pyblish QML in Maya\n")
-    register_dispatch_wrapper(threaded_wrapper)
+    """
 
-    app = QtWidgets.QApplication.instance()
-    app.aboutToQuit.connect(_on_application_quit)
-    _connect_host_event(app)
+    sys.stdout.write("Setting up Pyblish QML in %s\n" % label)
+
+    app = _app_instance()
+    _install_main_thread_invoker(app)
+    app.aboutToQuit.connect(_on_application_quit,
+                            QtCore.Qt.DirectConnection)
+    _connect_host_event(app, top_window)
 
     if settings.ContextLabel == settings.ContextLabelDefault:
-        settings.ContextLabel = "Maya"
+        settings.ContextLabel = label
     if settings.WindowTitle == settings.WindowTitleDefault:
-        settings.WindowTitle = "Pyblish (Maya)"
+        settings.WindowTitle = "Pyblish (%s)" % label
 
 
-def _install_houdini():
-    """Helper function to SideFx Houdini support"""
-    import hdefereval
+def _maya_main_window():
+    """Fetch Maya's main window without widget traversal
 
-    def threaded_wrapper(func, *args, **kwargs):
-        return hdefereval.executeInMainThreadWithResult(
-            func, *args, **kwargs)
+    MQtUtil.mainWindow() hands back the window pointer in a
+    single call, as opposed to enumerating and wrapping every
+    top-level widget to find it.
 
-    sys.stdout.write("Setting up Pyblish QML in Houdini\n")
-    register_dispatch_wrapper(threaded_wrapper)
+    """
 
-    app = QtWidgets.QApplication.instance()
-    app.aboutToQuit.connect(_on_application_quit)
-    _connect_host_event(app)
+    from maya import OpenMayaUI
 
-    if settings.ContextLabel == settings.ContextLabelDefault:
-        settings.ContextLabel = "Houdini"
-    if settings.WindowTitle == settings.WindowTitleDefault:
-        settings.WindowTitle = "Pyblish (Houdini)"
+    try:
+        from shiboken2 import wrapInstance
+    except ImportError:
+        try:
+            from shiboken import wrapInstance
+        except ImportError:
+            # E.g. mayapy without a GUI
+            return None
+
+    pointer = OpenMayaUI.MQtUtil.mainWindow()
+
+    if pointer is None:
+        return None
+
+    return wrapInstance(int(pointer), QtWidgets.QWidget)
+
+
+def _install_maya():
+    """Helper function to Autodesk Maya support"""
+    # The import doubles as host detection
+    from maya import utils  # noqa
+
+    _install_common("Maya", top_window=_maya_main_window())
+
+
+def _install_houdini():
+    """Helper function to SideFx Houdini support"""
+    # The import doubles as host detection
+    import hdefereval  # noqa
+
+    _install_common("Houdini")
 
 
 def _install_nuke():
@@ -365,70 +511,58 @@ def _install_nuke():
     if "--hiero" in nuke.rawArgs or "--studio" in nuke.rawArgs:
         raise ImportError
 
-    def threaded_wrapper(func, *args, **kwargs):
-        return nuke.executeInMainThreadWithResult(
-            func, args, kwargs)
-
-    sys.stdout.write("Setting up Pyblish QML in Nuke\n")
-    register_dispatch_wrapper(threaded_wrapper)
-
-    app = QtWidgets.QApplication.instance()
-    app.aboutToQuit.connect(_on_application_quit)
-    _connect_host_event(app)
-
-    if settings.ContextLabel == settings.ContextLabelDefault:
-        settings.ContextLabel = "Nuke"
-    if settings.WindowTitle == settings.WindowTitleDefault:
-        settings.WindowTitle = "Pyblish (Nuke)"
+    _install_common("Nuke")
 
 
 def _install_hiero():
     """Helper function to The Foundry Hiero support"""
-    import hiero
+    # The import doubles as host detection
+    import hiero  # noqa
     import nuke
 
     if "--hiero" not in nuke.rawArgs:
         raise ImportError
 
-    def threaded_wrapper(func, *args, **kwargs):
-        return hiero.core.executeInMainThreadWithResult(
-            func, args, kwargs)
-
-    sys.stdout.write("Setting up Pyblish QML in Hiero\n")
-    register_dispatch_wrapper(threaded_wrapper)
-
-    app = QtWidgets.QApplication.instance()
-    app.aboutToQuit.connect(_on_application_quit)
-    _connect_host_event(app)
-
-    if settings.ContextLabel == settings.ContextLabelDefault:
-        settings.ContextLabel = "Hiero"
-    if settings.WindowTitle == settings.WindowTitleDefault:
-        settings.WindowTitle = "Pyblish (Hiero)"
+    _install_common("Hiero")
 
 
 def _install_nukestudio():
-    """Helper function to The Foundry Hiero support"""
+    """Helper function to The Foundry NukeStudio support"""
     import nuke
 
     if "--studio" not in nuke.rawArgs:
         raise ImportError
 
-    def threaded_wrapper(func, *args, **kwargs):
-        return nuke.executeInMainThreadWithResult(
-            func, args, kwargs)
+    _install_common("NukeStudio")
 
-    sys.stdout.write("Setting up Pyblish QML in NukeStudio\n")
-    register_dispatch_wrapper(threaded_wrapper)
 
-    app = QtWidgets.QApplication.instance()
-    app.aboutToQuit.connect(_on_application_quit)
-    _connect_host_event(app)
+# Modules whose presence identifies each host; probed by
+# install_host() before attempting the corresponding install.
+_HOST_PROBES = (
+    ("maya", _install_maya),
+    ("hdefereval", _install_houdini),
+    ("nuke", _install_nuke),
+    ("hiero", _install_hiero),
+    ("nuke", _install_nukestudio),
+)
 
-    if settings.ContextLabel == settings.ContextLabelDefault:
-        settings.ContextLabel = "NukeStudio"
-    if settings.WindowTitle == settings.WindowTitleDefault:
-        settings.WindowTitle = "Pyblish (NukeStudio)"
+
+def _splash_pixmap():
+    """Return the splash pixmap, decoded once per process
+
+    QPixmap is implicitly shared, so every Splash can reuse
+    the same decode rather than re-reading the PNG from disk
+    on each show().
+
+    """
+
+    pixmap = _state.get("splashPixmap")
+
+    if pixmap is None:
+        pixmap = QtGui.QPixmap(SPLASH_PATH)
+        _state["splashPixmap"] = pixmap
+
+    return pixmap
 
 
 class Splash(QtWidgets.QWidget):
@@ -449,9 +583,8 @@ class Splash(QtWidgets.QWidget):
             QtCore.Qt.FramelessWindowHint
         )
 
-        pixmap = QtGui.QPixmap(SPLASH_PATH)
         image = QtWidgets.QLabel()
-        image.setPixmap(pixmap)
+        image.setPixmap(_splash_pixmap())
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(image)
@@ -460,24 +593,35 @@ class Splash(QtWidgets.QWidget):
         label.move(20, 170)
         label.show()
 
-        self.count = 0
         self.label = label
 
+        # Precomputed animation frames; indexing these avoids
+        # allocating a fresh string on every timer tick.
+        self.frames = ("loading",
+                       "loading.",
+                       "loading..",
+                       "loading...")
+
         self.setStyleSheet("""
             QLabel {
                 color: white
             }
         """)
 
-        loop = QtCore.QTimer()
-        loop.timeout.connect(self.animate)
-        loop.start(330)
+        # Cycle the frames off Qt's shared animation driver,
+        # rather than waking a dedicated QTimer per tick.
+        loop = QtCore.QVariantAnimation(self)
+        loop.setStartValue(0)
+        loop.setEndValue(len(self.frames))
+        loop.setDuration(330 * len(self.frames))
+        loop.setLoopCount(-1)
+        loop.valueChanged.connect(self.animate)
+        loop.start()
 
         self.loop = loop
 
-        self.animate()
+        self.animate(0)
         self.resize(200, 200)
 
-    def animate(self):
-        self.label.setText("loading" + "." * self.count)
-        self.count = (self.count + 1) % 4
+    def animate(self, frame):
+        self.label.setText(self.frames[frame % len(self.frames)])
@@ -10,6 +10,12 @@ import pyblish.plugin
 from ..vendor import six
 from ..vendor.six.moves import queue
 
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:
+    # Python < 3.8
+    shared_memory = resource_tracker = None
+
 
 class Proxy(object):
     """Messages sent from QML to parent process"""
@@ -153,6 +159,11 @@ class Proxy(object):
             else:
                 response = _byteify(json.loads(message, object_hook=_byteify))
 
+            if "shm" in response:
+                # The parent stashed a large response in shared
+                # memory and sent us a reference in its place.
+                response = json.loads(_from_shared_memory(response["shm"]))
+
         except TypeError as e:
             raise e
 
@@ -161,6 +172,40 @@ class Proxy(object):
             return response["payload"]
 
 
+def _from_shared_memory(reference):
+    """Read a response stashed in shared memory by the parent
+
+    Only close the segment here; the parent created it and
+    remains responsible for unlinking it once our next request
+    signals that it has been read.
+
+    Arguments:
+        reference (dict): Name and size of the segment to read
+
+    """
+
+    if shared_memory is None:
+        raise Exception(
+            "Got a shared memory reference, but this Python "
+            "does not support multiprocessing.shared_memory")
+
+    segment = shared_memory.SharedMemory(name=reference["name"])
+
+    try:
+        return bytes(segment.buf[:reference["size"]]).decode("ascii")
+
+    finally:
+        segment.close()
+
+        # Attaching registered the segment with our resource
+        # tracker, which would otherwise warn at exit and unlink
+        # what the parent owns.
+        try:
+            resource_tracker.unregister(segment._name, "shared_memory")
+        except Exception:
+            pass
+
+
 def _byteify(data):
     """Convert unicode to bytes"""
 
@@ -1,15 +1,38 @@
 import os
 import sys
 import json
+import signal
 import threading
 import subprocess
 
 from .. import _state
 from ..vendor import six
 
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python < 3.8
+    shared_memory = None
+
 CREATE_NO_WINDOW = 0x08000000
+CREATE_NEW_PROCESS_GROUP = 0x00000200
 IS_WIN32 = sys.platform == "win32"
 
+# Responses smaller than this stay on the pipe, where the
+# overhead of a shared memory segment outweighs the copy.
+SHM_THRESHOLD = 4096
+
+
+def _env_flag(name):
+    """Return True when environment variable `name` is truthy
+
+    A plain bool(os.getenv(...)) would treat "0" and "false"
+    as enabled; parse the accepted spellings instead.
+
+    """
+
+    return os.getenv(name, "").lower() in ("1", "true", "yes", "on")
+
 
 def default_wrapper(func, *args, **kwargs):
     return func(*args, **kwargs)
@@ -96,6 +119,19 @@ class Server(object):
         self.service = service
         self.listening = False
 
+        # Optionally pass large responses, such as a formatted
+        # context of many instances, via shared memory rather
+        # than copying them through the pipe.
+        self.use_shm = (
+            shared_memory is not None and
+            _env_flag("PYBLISH_QML_SHM")
+        )
+
+        # Segments handed to the child but not yet known to be
+        # read; the parent keeps them open (Windows destroys a
+        # segment with its last handle) and unlinks them itself.
+        self.shm_pending = []
+
         # The server may be run within Maya or some other host,
         # in which case we refer to it as running embedded.
         is_embedded = os.path.split(sys.executable)[-1].lower() != "python.exe"
@@ -121,6 +157,10 @@ class Server(object):
             # OSX and Linux users are left to fend for themselves.
             environ = os.environ.copy()
 
+        if self.use_shm:
+            # The child must know to expect shared memory references.
+            environ["PYBLISH_QML_SHM"] = "1"
+
         # Append PyQt5 to existing PYTHONPATH, if available
         environ["PYTHONPATH"] = os.pathsep.join(
             path for path in [os.getenv("PYTHONPATH"), pyqt5]
@@ -162,10 +202,15 @@ class Server(object):
             stderr=subprocess.STDOUT,
         )
 
-        if IS_WIN32 and is_embedded:
-            # This will prevent an embedded Python
-            # from opening an external terminal window.
-            kwargs["creationflags"] = CREATE_NO_WINDOW
+        if IS_WIN32:
+            # A separate process group is required for
+            # CTRL_BREAK_EVENT delivery in stop().
+            kwargs["creationflags"] = CREATE_NEW_PROCESS_GROUP
+
+            if is_embedded:
+                # This will prevent an embedded Python
+                # from opening an external terminal window.
+                kwargs["creationflags"] |= CREATE_NO_WINDOW
 
         # If no targets are passed to pyblish-qml, we assume that we want the
         # default target and the registered targets. This is to facilitate
@@ -181,13 +226,89 @@ class Server(object):
         self.popen = subprocess.Popen(**kwargs)
         self.listen()
 
+    def _to_shared_memory(self, data):
+        """Stash a large response in shared memory
+
+        Writes `data` to a fresh shared memory segment and returns
+        a small reference message to send over the pipe in its
+        place. The child reads and closes the segment, so only
+        the reference is ever copied through the kernel.
+
+        The parent keeps its own handle open until the child has
+        demonstrably consumed the segment - on Windows, a segment
+        is destroyed with its last open handle - and remains the
+        one to unlink it, keeping resource tracker ownership in
+        the process that created it.
+
+        Arguments:
+            data (bytes): Encoded response message
+
+        """
+
+        segment = shared_memory.SharedMemory(create=True, size=len(data))
+        segment.buf[:len(data)] = data
+        self.shm_pending.append(segment)
+
+        reference = json.dumps({
+            "header": "pyblish-qml:popen.response",
+            "shm": {"name": segment.name, "size": len(data)},
+        })
+
+        if six.PY3:
+            reference = reference.encode("ascii")
+
+        return reference
+
+    def _release_shared_memory(self):
+        """Free segments the child has finished reading
+
+        The child's dispatch is strictly request/response, so by
+        the time its next request arrives, every previously sent
+        segment has been read. Also called from stop(), once the
+        child is gone.
+
+        """
+
+        while self.shm_pending:
+            segment = self.shm_pending.pop()
+            segment.close()
+
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                # Already gone, e.g. unlinked by a dying child
+                pass
+
     def stop(self):
         try:
-            return self.popen.kill()
+            if IS_WIN32:
+                # TerminateProcess, which kill() maps to on
+                # Windows, leaks thread handles; ask the process
+                # group to exit cleanly first.
+                self.popen.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                self.popen.terminate()
+
+            try:
+                self.popen.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                self.popen.kill()
+                self.popen.wait()
+
         except OSError as e:
             # Assume process is already dead
             print(e)
 
+        # Closing the pipe handles here, after the process is
+        # reaped, is what releases them on Windows. Without this,
+        # each show/close cycle leaks until the Popen is GC'd.
+
+        for stream in (self.popen.stdin, self.popen.stdout):
+            if stream is not None:
+                stream.close()
+
+        self._release_shared_memory()
+
     def wait(self):
         return self.popen.wait()
 
@@ -216,6 +337,10 @@ class Server(object):
 
                 else:
                     if response.get("header") == "pyblish-qml:popen.request":
+                        # A new request means the child has read
+                        # any segment sent with earlier responses.
+                        self._release_shared_memory()
+
                         payload = response["payload"]
                         args = payload["args"]
 
@@ -241,6 +366,9 @@ class Server(object):
                         if six.PY3:
                             data = data.encode("ascii")
 
+                        if self.use_shm and len(data) > SHM_THRESHOLD:
+                            data = self._to_shared_memory(data)
+
                         self.popen.stdin.write(data + b"\n")
                         self.popen.stdin.flush()
 